@@ -0,0 +1,80 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+import threading
+import time
+
+class Clock(ABC):
+    """Source of the current time in seconds since the epoch."""
+
+    @abstractmethod
+    def now(self) -> float:
+        """Return the current time."""
+
+class SystemClock(Clock):
+    """Reads the system clock on every call."""
+
+    def now(self) -> float:
+        return time.time()
+
+class CoarseClock(Clock):
+    """
+    Cached clock refreshed on a tick.
+
+    now() returns the reading taken at the last tick, so hot paths pay an
+    attribute read instead of a syscall. Call tick() yourself or start() a
+    background thread that ticks every ``interval`` seconds.
+    """
+
+    def __init__(self, interval: float = 0.001):
+        if interval <= 0:
+            raise ValueError("Tick interval must be positive")
+        self.interval = interval
+        self._now = time.time()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def now(self) -> float:
+        return self._now
+
+    def tick(self) -> None:
+        """Refresh the cached reading from the system clock."""
+        self._now = time.time()
+
+    def start(self) -> None:
+        """Start ticking in a background daemon thread."""
+        if self._thread is not None:
+            raise RuntimeError("Coarse clock already started")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread, if running."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.tick()
+
+class ManualClock(Clock):
+    """Clock that only moves when told to, for tests and replay."""
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+
+    def now(self) -> float:
+        return self._now
+
+    def set(self, timestamp: float) -> None:
+        """Jump to an absolute timestamp."""
+        self._now = timestamp
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward by the given number of seconds."""
+        if seconds < 0:
+            raise ValueError("Cannot advance clock by a negative amount")
+        self._now += seconds
@@ -0,0 +1,204 @@
+from array import array
+from typing import Dict, Iterable, List
+from .authority import AuthorityUnit
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    _np = None
+
+class ColumnarAuthorityStore:
+    """
+    Columnar backing for authority units used by bulk operations.
+
+    Timestamps, prices and interned scope codes are held in contiguous arrays,
+    one row per issued authority unit. NumPy arrays are used when NumPy is
+    installed so bulk scans run vectorized; otherwise the standard library
+    ``array`` module provides the same layout with plain loops.
+
+    Prices above the signed 64-bit range are kept outside the price column
+    and added back as Python ints, so any valid authority unit can be stored.
+    """
+
+    _INITIAL_CAPACITY = 1024
+
+    # Largest price that fits the signed 64-bit price column
+    MAX_PRICE = 2**63 - 1
+
+    def __init__(self):
+        self.use_numpy = _np is not None
+
+        # Row index for each authority ID
+        self.row_by_id: Dict[str, int] = {}
+
+        # Interned scopes: code -> scope and scope -> code
+        self.scopes: List[str] = []
+        self.scope_codes: Dict[str, int] = {}
+
+        # Prices too large for the price column, keyed by row
+        self.large_prices: Dict[int, int] = {}
+
+        self._size = 0
+        if self.use_numpy:
+            self._timestamps = _np.empty(self._INITIAL_CAPACITY, dtype=_np.float64)
+            self._prices = _np.empty(self._INITIAL_CAPACITY, dtype=_np.int64)
+            self._scope_ids = _np.empty(self._INITIAL_CAPACITY, dtype=_np.int32)
+        else:
+            self._timestamps = array("d")
+            self._prices = array("q")
+            self._scope_ids = array("i")
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, au_id: str) -> bool:
+        return au_id in self.row_by_id
+
+    @property
+    def timestamps(self):
+        """Issue timestamps, one per row."""
+        return self._timestamps[:self._size]
+
+    @property
+    def prices(self):
+        """Prices, one per row."""
+        return self._prices[:self._size]
+
+    @property
+    def scope_ids(self):
+        """Interned scope codes, one per row."""
+        return self._scope_ids[:self._size]
+
+    def add(self, au: AuthorityUnit) -> None:
+        """Append an authority unit as a new row."""
+        if au.id in self.row_by_id:
+            raise ValueError(f"Authority with ID {au.id} already exists")
+
+        # Convert every value before touching a column so a rejected unit
+        # cannot leave the columns out of step
+        timestamp = float(au.timestamp)
+        large = au.price > self.MAX_PRICE
+        column_price = 0 if large else au.price
+
+        code = self.scope_codes.get(au.scope)
+        new_scope = code is None
+        if new_scope:
+            code = len(self.scopes)
+
+        row = self._size
+        if self.use_numpy:
+            if row == len(self._timestamps):
+                self._grow()
+            self._timestamps[row] = timestamp
+            self._prices[row] = column_price
+            self._scope_ids[row] = code
+        else:
+            self._timestamps.append(timestamp)
+            self._prices.append(column_price)
+            self._scope_ids.append(code)
+
+        # Intern the scope only once the row has been written
+        if large:
+            self.large_prices[row] = au.price
+        if new_scope:
+            self.scopes.append(au.scope)
+            self.scope_codes[au.scope] = code
+        self.row_by_id[au.id] = row
+        self._size += 1
+
+    def _grow(self) -> None:
+        """Double the capacity of the NumPy columns."""
+        capacity = 2 * len(self._timestamps)
+        for name in ("_timestamps", "_prices", "_scope_ids"):
+            old = getattr(self, name)
+            new = _np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def _unexpired_mask(self, current_time: float, max_age_seconds: int):
+        # Same comparison as AuthorityUnit.is_valid, applied to every row
+        return (current_time - self.timestamps) <= max_age_seconds
+
+    def validate_many(
+        self,
+        au_ids: Iterable[str],
+        current_time: float,
+        max_age_seconds: int = 3600
+    ) -> List[bool]:
+        """
+        Check that each ID was issued and has not expired.
+
+        Returns one boolean per input ID, in input order.
+        """
+        row_by_id = self.row_by_id
+        if not self.use_numpy:
+            timestamps = self._timestamps
+            results = []
+            for au_id in au_ids:
+                row = row_by_id.get(au_id)
+                results.append(
+                    row is not None
+                    and current_time - timestamps[row] <= max_age_seconds
+                )
+            return results
+
+        rows = _np.fromiter(
+            (row_by_id.get(au_id, -1) for au_id in au_ids),
+            dtype=_np.int64
+        )
+        known = rows >= 0
+        valid = _np.zeros(len(rows), dtype=bool)
+        valid[known] = (
+            current_time - self._timestamps[rows[known]]
+        ) <= max_age_seconds
+        return valid.tolist()
+
+    def count_unexpired_by_scope(
+        self,
+        current_time: float,
+        max_age_seconds: int = 3600
+    ) -> Dict[str, int]:
+        """Count unexpired authority units per scope."""
+        if not self.use_numpy:
+            counts = [0] * len(self.scopes)
+            for ts, code in zip(self._timestamps, self._scope_ids):
+                if current_time - ts <= max_age_seconds:
+                    counts[code] += 1
+        else:
+            mask = self._unexpired_mask(current_time, max_age_seconds)
+            counts = _np.bincount(
+                self.scope_ids[mask], minlength=len(self.scopes)
+            ).tolist()
+        return {
+            scope: count
+            for scope, count in zip(self.scopes, counts)
+            if count
+        }
+
+    def sum_outstanding_price(
+        self,
+        current_time: float,
+        max_age_seconds: int = 3600
+    ) -> int:
+        """Sum the price of all unexpired authority units."""
+        timestamps = self._timestamps
+        total = sum(
+            price
+            for row, price in self.large_prices.items()
+            if current_time - timestamps[row] <= max_age_seconds
+        )
+        if not self.use_numpy:
+            return total + sum(
+                price
+                for ts, price in zip(timestamps, self._prices)
+                if current_time - ts <= max_age_seconds
+            )
+        mask = self._unexpired_mask(current_time, max_age_seconds)
+        selected = self.prices[mask]
+        if not len(selected):
+            return total
+        # Prices are non-negative, so the int64 sum cannot wrap if this bound
+        # holds; otherwise sum as Python ints like the object path does
+        if int(selected.max()) * len(selected) <= self.MAX_PRICE:
+            return total + int(selected.sum())
+        return total + sum(selected.tolist())
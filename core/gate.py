@@ -1,21 +1,45 @@
-from typing import Callable, Any
+from typing import Callable, Any, Optional
 from .authority import AuthorityUnit
+from .clock import Clock, SystemClock
 from .trace import DecisionTrace, LiabilityRecord
-import time
 
 class ExecutionGateError(Exception):
     """Custom exception for execution gate errors."""
     pass
 
+def _owner_clock(fn: Optional[Callable[..., bool]]) -> Optional[Clock]:
+    """Return the clock of the object a bound-method validator belongs to."""
+    owner = getattr(fn, "__self__", None)
+    clock = getattr(owner, "clock", None)
+    return clock if isinstance(clock, Clock) else None
+
 class ExecutionGate:
     """
     The mandatory interception point for any autonomous action.
     
     Invariant: Blocks execution absent a valid AU.
+    
+    The clock is read once per action and the reading is stamped on the
+    trace and liability record. A ``validator`` is called with the authority
+    unit only; a ``time_validator`` is also given the reading, so validation
+    and trace agree on the time. Without an explicit clock, a validator bound
+    to an object with a ``clock`` (such as AuthorityManager.validate_authority)
+    shares that clock; otherwise the system clock is used.
     """
     
-    def __init__(self, validator: Callable[[AuthorityUnit], bool]):
+    def __init__(
+        self,
+        validator: Optional[Callable[[AuthorityUnit], bool]] = None,
+        clock: Optional[Clock] = None,
+        time_validator: Optional[Callable[[AuthorityUnit, float], bool]] = None
+    ):
+        if (validator is None) == (time_validator is None):
+            raise ValueError("Exactly one of validator or time_validator must be provided")
         self.validator = validator
+        self.time_validator = time_validator
+        if clock is None:
+            clock = _owner_clock(validator or time_validator) or SystemClock()
+        self.clock = clock
         self.consumed_au_ids = set()
         
     def execute_with_authority(
@@ -40,8 +64,15 @@ class ExecutionGate:
         Raises:
             ExecutionGateError: If validation fails or execution cannot proceed
         """
+        # Single time reading for this action
+        now = self.clock.now()
+        
         # Validate authority unit
-        if not self.validator(au):
+        if self.time_validator is not None:
+            valid = self.time_validator(au, now)
+        else:
+            valid = self.validator(au)
+        if not valid:
             raise ExecutionGateError(f"Invalid authority unit: {au.id}")
         
         # Check if already consumed
@@ -65,7 +96,7 @@ class ExecutionGate:
             dt = DecisionTrace(
                 action_name=action_name,
                 authority_id=au.id,
-                timestamp=time.time(),
+                timestamp=now,
                 result=result
             )
             
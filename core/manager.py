@@ -1,7 +1,8 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from .authority import AuthorityUnit
+from .clock import Clock, SystemClock
+from .columnar import ColumnarAuthorityStore
 from .gate import ExecutionGate
-import time
 
 class AuthorityManager:
     """
@@ -9,22 +10,41 @@ class AuthorityManager:
     
     This class is responsible for maintaining the state of available authorities
     and providing validation functions to the execution gate.
+    
+    With ``columnar=True`` issued authorities are also mirrored into a
+    ColumnarAuthorityStore so bulk operations run as array scans instead of
+    per-object calls.
+    
+    All expiry checks read time from ``clock``, which defaults to the system
+    clock.
     """
     
-    def __init__(self):
+    def __init__(self, columnar: bool = False, clock: Optional[Clock] = None):
+        self.clock = clock if clock is not None else SystemClock()
         self.authorities: Dict[str, AuthorityUnit] = {}
+        self.store: Optional[ColumnarAuthorityStore] = (
+            ColumnarAuthorityStore() if columnar else None
+        )
         
     def issue_authority(self, au: AuthorityUnit) -> None:
         """Issue a new authority unit."""
         if au.id in self.authorities:
             raise ValueError(f"Authority with ID {au.id} already exists")
+        if self.store is not None:
+            self.store.add(au)
         self.authorities[au.id] = au
         
-    def validate_authority(self, au: AuthorityUnit) -> bool:
+    def validate_authority(
+        self,
+        au: AuthorityUnit,
+        current_time: Optional[float] = None
+    ) -> bool:
         """
         Validate an authority unit.
         
-        Returns True if the authority is valid and available for use.
+        Returns True if the authority is valid and available for use. A gate
+        from create_gate passes its own reading as ``current_time`` so each
+        action reads the clock once; otherwise the manager's clock is used.
         """
         # Check if it exists
         if au.id not in self.authorities:
@@ -38,7 +58,8 @@ class AuthorityManager:
             return False
             
         # Check if it's still valid (not expired)
-        current_time = time.time()
+        if current_time is None:
+            current_time = self.clock.now()
         if not au.is_valid(current_time):
             return False
             
@@ -46,4 +67,61 @@ class AuthorityManager:
         
     def get_authority(self, au_id: str) -> Optional[AuthorityUnit]:
         """Get an authority unit by ID."""
-        return self.authorities.get(au_id)
\ No newline at end of file
+        return self.authorities.get(au_id)
+    
+    def create_gate(self) -> ExecutionGate:
+        """
+        Create an execution gate wired to this manager.
+        
+        The gate shares the manager's clock and passes its single reading per
+        action to validate_authority.
+        """
+        return ExecutionGate(time_validator=self.validate_authority, clock=self.clock)
+    
+    def validate_many(
+        self,
+        au_ids: Iterable[str],
+        current_time: Optional[float] = None
+    ) -> List[bool]:
+        """
+        Validate many authority units by ID.
+        
+        Unlike validate_authority, only issuance and expiry are checked; there
+        is no unit to compare against the stored one.
+        """
+        if current_time is None:
+            current_time = self.clock.now()
+        if self.store is not None:
+            return self.store.validate_many(au_ids, current_time)
+        return [
+            au_id in self.authorities
+            and self.authorities[au_id].is_valid(current_time)
+            for au_id in au_ids
+        ]
+    
+    def count_unexpired_by_scope(
+        self,
+        current_time: Optional[float] = None
+    ) -> Dict[str, int]:
+        """Count unexpired authority units per scope."""
+        if current_time is None:
+            current_time = self.clock.now()
+        if self.store is not None:
+            return self.store.count_unexpired_by_scope(current_time)
+        counts: Dict[str, int] = {}
+        for au in self.authorities.values():
+            if au.is_valid(current_time):
+                counts[au.scope] = counts.get(au.scope, 0) + 1
+        return counts
+    
+    def sum_outstanding_price(self, current_time: Optional[float] = None) -> int:
+        """Sum the price of all unexpired authority units."""
+        if current_time is None:
+            current_time = self.clock.now()
+        if self.store is not None:
+            return self.store.sum_outstanding_price(current_time)
+        return sum(
+            au.price
+            for au in self.authorities.values()
+            if au.is_valid(current_time)
+        )
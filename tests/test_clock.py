@@ -0,0 +1,71 @@
+import time
+import pytest
+from able.core.clock import Clock, CoarseClock, ManualClock, SystemClock
+
+def test_system_clock_reads_time():
+    """Test that SystemClock tracks the system clock."""
+    before = time.time()
+    reading = SystemClock().now()
+    after = time.time()
+    
+    assert before <= reading <= after
+
+def test_manual_clock_set_and_advance():
+    """Test that ManualClock only moves when told to."""
+    clock = ManualClock(1640995200.0)
+    
+    assert clock.now() == 1640995200.0
+    assert clock.now() == 1640995200.0
+    
+    clock.advance(30)
+    assert clock.now() == 1640995230.0
+    
+    clock.set(1000.0)
+    assert clock.now() == 1000.0
+
+def test_manual_clock_negative_advance():
+    """Test that ManualClock refuses to move backwards via advance."""
+    clock = ManualClock()
+    
+    with pytest.raises(ValueError, match="negative"):
+        clock.advance(-1)
+
+def test_coarse_clock_cached_until_tick(monkeypatch):
+    """Test that CoarseClock returns the cached reading between ticks."""
+    clock = CoarseClock()
+    monkeypatch.setattr(time, "time", lambda: 2000.0)
+    
+    # No tick yet, so the cached reading is unchanged
+    assert clock.now() != 2000.0
+    
+    clock.tick()
+    assert clock.now() == 2000.0
+
+def test_coarse_clock_background_tick():
+    """Test that a started CoarseClock refreshes itself."""
+    clock = CoarseClock(interval=0.001)
+    first = clock.now()
+    clock.start()
+    try:
+        with pytest.raises(RuntimeError, match="already started"):
+            clock.start()
+        deadline = time.time() + 1.0
+        while clock.now() == first and time.time() < deadline:
+            time.sleep(0.005)
+    finally:
+        clock.stop()
+    
+    assert clock.now() > first
+
+def test_coarse_clock_invalid_interval():
+    """Test that CoarseClock rejects a non-positive interval."""
+    with pytest.raises(ValueError, match="must be positive"):
+        CoarseClock(interval=0)
+
+def test_clock_requires_now():
+    """Test that a Clock subclass without now() cannot be instantiated."""
+    class BrokenClock(Clock):
+        pass
+    
+    with pytest.raises(TypeError):
+        BrokenClock()
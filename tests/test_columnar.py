@@ -0,0 +1,156 @@
+import pytest
+from able.core import columnar
+from able.core.authority import AuthorityUnit
+from able.core.columnar import ColumnarAuthorityStore
+from able.core.manager import AuthorityManager
+
+ISSUED_AT = 1640995200.0
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    """Run each test against both the NumPy and the array-module backends."""
+    if request.param == "numpy":
+        if columnar._np is None:
+            pytest.skip("NumPy not installed")
+    else:
+        monkeypatch.setattr(columnar, "_np", None)
+    return request.param
+
+def make_au(au_id, scope="read", price=10, timestamp=ISSUED_AT):
+    return AuthorityUnit(
+        id=au_id,
+        scope=scope,
+        delegation_chain=["root"],
+        price=price,
+        timestamp=timestamp
+    )
+
+def test_store_add_and_columns(backend):
+    """Test that the store keeps one row per authority unit."""
+    store = ColumnarAuthorityStore()
+    assert store.use_numpy == (backend == "numpy")
+
+    store.add(make_au("a", scope="read", price=5))
+    store.add(make_au("b", scope="write", price=7))
+    store.add(make_au("c", scope="read", price=9))
+
+    assert len(store) == 3
+    assert "b" in store
+    assert list(store.prices) == [5, 7, 9]
+    assert [store.scopes[code] for code in store.scope_ids] == ["read", "write", "read"]
+
+def test_store_duplicate_add(backend):
+    """Test that the store rejects duplicate authority IDs."""
+    store = ColumnarAuthorityStore()
+    store.add(make_au("a"))
+
+    with pytest.raises(ValueError, match="already exists"):
+        store.add(make_au("a"))
+
+def test_store_grows_past_initial_capacity(backend):
+    """Test that rows survive column growth."""
+    store = ColumnarAuthorityStore()
+    count = ColumnarAuthorityStore._INITIAL_CAPACITY + 1
+    for i in range(count):
+        store.add(make_au(f"au-{i}", price=i))
+
+    assert len(store) == count
+    assert store.sum_outstanding_price(ISSUED_AT) == sum(range(count))
+
+def test_store_validate_many(backend):
+    """Test that bulk validation matches AuthorityUnit.is_valid."""
+    store = ColumnarAuthorityStore()
+    store.add(make_au("fresh", timestamp=ISSUED_AT))
+    store.add(make_au("edge", timestamp=ISSUED_AT - 3600))
+    store.add(make_au("stale", timestamp=ISSUED_AT - 3700))
+
+    ids = ["fresh", "missing", "edge", "stale", "fresh"]
+    assert store.validate_many(ids, ISSUED_AT) == [True, False, True, False, True]
+    assert store.validate_many([], ISSUED_AT) == []
+
+def test_store_scope_and_price_scans(backend):
+    """Test that scope counts and price sums skip expired units."""
+    store = ColumnarAuthorityStore()
+    store.add(make_au("a", scope="read", price=5))
+    store.add(make_au("b", scope="write", price=7))
+    store.add(make_au("c", scope="read", price=9))
+    store.add(make_au("d", scope="write", price=11, timestamp=ISSUED_AT - 3700))
+
+    assert store.count_unexpired_by_scope(ISSUED_AT) == {"read": 2, "write": 1}
+    assert store.sum_outstanding_price(ISSUED_AT) == 21
+
+    # Everything has expired an hour later
+    assert store.count_unexpired_by_scope(ISSUED_AT + 3700) == {}
+    assert store.sum_outstanding_price(ISSUED_AT + 3700) == 0
+
+@pytest.mark.parametrize("use_columnar", [False, True])
+def test_manager_bulk_operations(backend, use_columnar):
+    """Test that manager bulk operations agree with and without the store."""
+    manager = AuthorityManager(columnar=use_columnar)
+    assert (manager.store is not None) == use_columnar
+
+    manager.issue_authority(make_au("a", scope="read", price=5))
+    manager.issue_authority(make_au("b", scope="any", price=7))
+    manager.issue_authority(make_au("c", scope="read", price=9, timestamp=ISSUED_AT - 3700))
+
+    assert manager.validate_many(["a", "b", "c", "x"], ISSUED_AT) == [True, True, False, False]
+    assert manager.count_unexpired_by_scope(ISSUED_AT) == {"read": 1, "any": 1}
+    assert manager.sum_outstanding_price(ISSUED_AT) == 12
+
+def test_manager_columnar_duplicate_issue(backend):
+    """Test that a rejected duplicate leaves the store unchanged."""
+    manager = AuthorityManager(columnar=True)
+    manager.issue_authority(make_au("a"))
+
+    with pytest.raises(ValueError, match="already exists"):
+        manager.issue_authority(make_au("a", price=99))
+
+    assert len(manager.store) == 1
+    assert manager.sum_outstanding_price(ISSUED_AT) == 10
+
+def test_store_failed_add_leaves_no_partial_row(backend):
+    """Test that a failed add leaves the columns in step for later adds."""
+    manager = AuthorityManager(columnar=True)
+
+    with pytest.raises(ValueError):
+        manager.issue_authority(
+            make_au("bad", scope="huge", timestamp="not-a-time")
+        )
+
+    assert len(manager.store) == 0
+    assert manager.store.scopes == []
+    assert manager.get_authority("bad") is None
+
+    b = make_au("b", timestamp=0.0)
+    manager.issue_authority(b)
+
+    assert manager.validate_many(["b"], 10000.0) == [b.is_valid(10000.0)] == [False]
+    assert manager.count_unexpired_by_scope(0.0) == {"read": 1}
+    assert manager.store.scopes == ["read"]
+
+def test_store_accepts_price_beyond_int64(backend):
+    """Test that prices beyond the int64 column are stored and summed."""
+    plain = AuthorityManager()
+    columnar_manager = AuthorityManager(columnar=True)
+    for manager in (plain, columnar_manager):
+        manager.issue_authority(make_au("big", price=2**63, timestamp=10000.0))
+        manager.issue_authority(make_au("b", price=5, timestamp=0.0))
+
+    for manager in (plain, columnar_manager):
+        assert manager.validate_many(["big", "b"], 10000.0) == [True, False]
+        assert manager.sum_outstanding_price(10000.0) == 2**63
+        assert manager.sum_outstanding_price(0.0) == 2**63 + 5
+        assert manager.sum_outstanding_price(20000.0) == 0
+
+def test_store_large_price_sum_matches_object_path(backend):
+    """Test that large price sums agree with the non-columnar manager."""
+    plain = AuthorityManager()
+    columnar_manager = AuthorityManager(columnar=True)
+    for manager in (plain, columnar_manager):
+        manager.issue_authority(make_au("a", price=2**62))
+        manager.issue_authority(make_au("b", price=2**62))
+        manager.issue_authority(make_au("c", price=2**63 - 1))
+
+    expected = 2**62 + 2**62 + 2**63 - 1
+    assert plain.sum_outstanding_price(ISSUED_AT) == expected
+    assert columnar_manager.sum_outstanding_price(ISSUED_AT) == expected
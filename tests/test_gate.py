@@ -1,7 +1,9 @@
 import pytest
 from unittest.mock import Mock
 from able.core.authority import AuthorityUnit
+from able.core.clock import ManualClock
 from able.core.gate import ExecutionGate, ExecutionGateError
+from able.core.manager import AuthorityManager
 from able.core.trace import DecisionTrace, LiabilityRecord
 
 def test_execution_gate_valid_authority():
@@ -202,4 +204,186 @@ def test_execution_gate_any_scope():
         action_fn=sample_action,
         action_name="write_data",
         action_scope="write"
-    )
\ No newline at end of file
+    )
+
+def test_execution_gate_single_clock_reading():
+    """Test that time_validator, trace and liability share one clock reading."""
+    clock = Mock()
+    clock.now.return_value = 1640995300.0
+    validator = Mock(return_value=True)
+    
+    gate = ExecutionGate(time_validator=validator, clock=clock)
+    
+    au = AuthorityUnit(
+        id="test-123",
+        scope="read",
+        delegation_chain=["root"],
+        price=10,
+        timestamp=1640995200.0
+    )
+    
+    trace, liability = gate.execute_with_authority(
+        au=au,
+        action_fn=lambda: "success",
+        action_name="test_action",
+        action_scope="read"
+    )
+    
+    assert clock.now.call_count == 1
+    validator.assert_called_once_with(au, 1640995300.0)
+    assert trace.timestamp == 1640995300.0
+    assert liability.timestamp == 1640995300.0
+
+def test_execution_gate_expiry_with_manual_clock():
+    """Test deterministic expiry through a gate created by the manager."""
+    clock = ManualClock(1640995200.0)
+    manager = AuthorityManager(clock=clock)
+    gate = manager.create_gate()
+    assert gate.clock is clock
+    
+    first = AuthorityUnit(
+        id="test-123",
+        scope="read",
+        delegation_chain=["root"],
+        price=10,
+        timestamp=1640995200.0
+    )
+    second = AuthorityUnit(
+        id="test-456",
+        scope="read",
+        delegation_chain=["root"],
+        price=10,
+        timestamp=1640995200.0
+    )
+    manager.issue_authority(first)
+    manager.issue_authority(second)
+    
+    trace, liability = gate.execute_with_authority(
+        au=first,
+        action_fn=lambda: "success",
+        action_name="test_action",
+        action_scope="read"
+    )
+    assert trace.timestamp == 1640995200.0
+    
+    # Still unexpired, so reuse is rejected by the consumed check
+    with pytest.raises(ExecutionGateError, match="already consumed"):
+        gate.execute_with_authority(
+            au=first,
+            action_fn=lambda: "success",
+            action_name="test_action",
+            action_scope="read"
+        )
+    
+    # Expired, so the unused unit is rejected by validation
+    clock.advance(3700)
+    with pytest.raises(ExecutionGateError, match="Invalid authority unit"):
+        gate.execute_with_authority(
+            au=second,
+            action_fn=lambda: "success",
+            action_name="test_action",
+            action_scope="read"
+        )
+
+def test_execution_gate_inherits_manager_clock():
+    """Test that a gate built without a clock uses the manager's clock."""
+    clock = ManualClock(1000.0)
+    manager = AuthorityManager(clock=clock)
+    gate = ExecutionGate(manager.validate_authority)
+    assert gate.clock is clock
+    
+    au = AuthorityUnit(
+        id="test-123",
+        scope="read",
+        delegation_chain=["root"],
+        price=10,
+        timestamp=1000.0
+    )
+    manager.issue_authority(au)
+    
+    assert manager.validate_authority(au) == True
+    trace, liability = gate.execute_with_authority(
+        au=au,
+        action_fn=lambda: "success",
+        action_name="test_action",
+        action_scope="read"
+    )
+    assert trace.timestamp == 1000.0
+
+def test_execution_gate_one_argument_validator():
+    """Test that a plain one-argument validator still works."""
+    seen = []
+    
+    def validator(au):
+        seen.append(au.id)
+        return au.price <= 10
+    
+    gate = ExecutionGate(validator, clock=ManualClock(1640995200.0))
+    
+    cheap = AuthorityUnit(
+        id="test-123",
+        scope="read",
+        delegation_chain=["root"],
+        price=10,
+        timestamp=1640995200.0
+    )
+    pricey = AuthorityUnit(
+        id="test-456",
+        scope="read",
+        delegation_chain=["root"],
+        price=20,
+        timestamp=1640995200.0
+    )
+    
+    trace, liability = gate.execute_with_authority(
+        au=cheap,
+        action_fn=lambda: "success",
+        action_name="test_action",
+        action_scope="read"
+    )
+    assert trace.timestamp == 1640995200.0
+    
+    with pytest.raises(ExecutionGateError, match="Invalid authority unit"):
+        gate.execute_with_authority(
+            au=pricey,
+            action_fn=lambda: "success",
+            action_name="test_action",
+            action_scope="read"
+        )
+    
+    assert seen == ["test-123", "test-456"]
+
+def test_execution_gate_defaulted_second_parameter():
+    """Test that a validator with an optional second parameter gets only the AU."""
+    seen = []
+    
+    def validator(au, max_age=60):
+        seen.append(max_age)
+        return True
+    
+    gate = ExecutionGate(validator, clock=ManualClock(1640995200.0))
+    
+    au = AuthorityUnit(
+        id="test-123",
+        scope="read",
+        delegation_chain=["root"],
+        price=10,
+        timestamp=1640995200.0
+    )
+    
+    gate.execute_with_authority(
+        au=au,
+        action_fn=lambda: "success",
+        action_name="test_action",
+        action_scope="read"
+    )
+    
+    assert seen == [60]
+
+def test_execution_gate_requires_one_validator():
+    """Test that exactly one of validator or time_validator is accepted."""
+    with pytest.raises(ValueError, match="Exactly one"):
+        ExecutionGate()
+    
+    with pytest.raises(ValueError, match="Exactly one"):
+        ExecutionGate(Mock(return_value=True), time_validator=Mock(return_value=True))
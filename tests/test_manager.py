@@ -1,5 +1,6 @@
 import pytest
 from able.core.authority import AuthorityUnit
+from able.core.clock import ManualClock
 from able.core.manager import AuthorityManager
 
 def test_authority_manager_issue_authority():
@@ -39,7 +40,7 @@ def test_authority_manager_duplicate_issue():
 
 def test_authority_manager_validate_valid():
     """Test that manager validates valid authorities."""
-    manager = AuthorityManager()
+    manager = AuthorityManager(clock=ManualClock(1640995200.0))
     
     au = AuthorityUnit(
         id="test-123",
@@ -99,4 +100,30 @@ def test_authority_manager_get_nonexistent():
     manager = AuthorityManager()
     
     result = manager.get_authority("nonexistent")
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+def test_authority_manager_clock_expiry():
+    """Test that manager expiry follows the injected clock."""
+    clock = ManualClock(1640995200.0)
+    manager = AuthorityManager(clock=clock)
+    
+    au = AuthorityUnit(
+        id="test-123",
+        scope="read",
+        delegation_chain=["root"],
+        price=10,
+        timestamp=1640995200.0
+    )
+    
+    manager.issue_authority(au)
+    
+    clock.advance(3600)
+    assert manager.validate_authority(au) == True
+    assert manager.sum_outstanding_price() == 10
+    
+    clock.advance(1)
+    assert manager.validate_authority(au) == False
+    assert manager.validate_many(["test-123"]) == [False]
+    
+    # An explicit reading overrides the clock
+    assert manager.validate_authority(au, 1640995200.0) == True